@@ -5,6 +5,7 @@
 #
 
 import argparse
+import asyncio
 import os
 import subprocess
 from contextlib import asynccontextmanager
@@ -113,7 +114,10 @@ async def start_bot(request: Request) -> JSONResponse:
             raise HTTPException(status_code=500, detail=f"Failed to spawn VM: {e}")
     else:
         try:
-            subprocess.Popen(
+            # Popen forks and execs synchronously; run it in a worker thread
+            # so it doesn't stall the server's event loop.
+            await asyncio.to_thread(
+                subprocess.Popen,
                 [f"python -m bot -u {room.url} -t {token}"],
                 shell=True,
                 bufsize=1,
@@ -1,8 +1,8 @@
+import asyncio
 import os
 import re
 
 import google.ai.generativelanguage as glm
-from async_timeout import timeout
 from loguru import logger
 from prompts import (
     CUE_ASSISTANT_TURN,
@@ -26,6 +26,17 @@ from pipecat.transports.services.daily import DailyTransportMessageFrame
 
 sounds = load_sounds(["talking.wav", "listening.wav", "ding.wav"])
 
+# Bind the frames we push on every turn transition once, so the handlers
+# skip the dict lookup.
+_TALKING_SOUND = sounds["talking"]
+_LISTENING_SOUND = sounds["listening"]
+
+# Compiled once at import time so the streaming hot path doesn't pay the
+# `re` cache lookup on every TextFrame. The [break] marker is a fixed
+# token, so plain str.find on a lowercased copy beats the regex engine.
+_IMAGE_RE = re.compile(r"<(.*?)>")
+_BREAK_TOKEN = "[break]"
+
 # -------------- Frame Types ------------- #
 
 
@@ -75,7 +86,7 @@ class StoryImageProcessor(FrameProcessor):
 
         if isinstance(frame, StoryPageFrame):
             # Special syntax for the first page
-            if self.pages == []:
+            if not self.pages:
                 prompt = FIRST_IMAGE_PROMPT % frame.text
             else:
                 prompt = NEXT_IMAGE_PROMPT % (
@@ -94,7 +105,7 @@ class StoryImageProcessor(FrameProcessor):
             self.pages.append(frame.text)
             self.image_descriptions.append(image_description)
             try:
-                async with timeout(15):
+                async with asyncio.timeout(15):
                     async for i in self._image_gen_service.run_image_gen(
                         IMAGE_GEN_PROMPT % image_description
                     ):
@@ -128,68 +139,116 @@ class StoryProcessor(FrameProcessor):
         self._messages = messages
         self._text = ""
         self._story = story
+        # Offset into _text below which we already know there are no "<" or
+        # "[" sentinels, so each new frame only scans the unseen tail.
+        self._scanned = 0
+        # Exact-type dispatch is an O(1) dict lookup per frame; subclasses of
+        # TextFrame fall back to the isinstance check in process_frame.
+        self._dispatch = {
+            UserStoppedSpeakingFrame: self._handle_user_stopped_speaking,
+            TextFrame: self._handle_text,
+            LLMFullResponseEndFrame: self._handle_llm_response_end,
+        }
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, UserStoppedSpeakingFrame):
-            # Send an app message to the UI
-            await self.push_frame(DailyTransportMessageFrame(CUE_ASSISTANT_TURN))
-            await self.push_frame(sounds["talking"])
+        handler = self._dispatch.get(type(frame))
+        if handler is None and isinstance(frame, TextFrame):
+            handler = self._handle_text
+        if handler:
+            await handler(frame)
+        else:
+            # Anything that is not handled above passes through
+            await self.push_frame(frame)
 
-        elif isinstance(frame, TextFrame):
-            # Add new text to the buffer
-            # (character replace hack to fix TTS sequencing)
-            self._text += frame.text.replace(";", "—")
+    async def _handle_user_stopped_speaking(self, frame: UserStoppedSpeakingFrame):
+        # Send an app message to the UI
+        await self._push_frames([DailyTransportMessageFrame(CUE_ASSISTANT_TURN), _TALKING_SOUND])
+
+    async def _handle_text(self, frame: TextFrame):
+        # Add new text to the buffer
+        # (character replace hack to fix TTS sequencing)
+        chunk = frame.text.replace(";", "—")
+        # Fast path: most LLM chunks carry no token characters at all. If
+        # nothing is pending in the buffer and the new chunk has no "<" or
+        # "[", there is nothing to scan for — two C-level substring checks
+        # replace the whole pattern pass.
+        pending = self._scanned < len(self._text)
+        self._text += chunk
+        if not pending and "<" not in chunk and "[" not in chunk:
+            self._scanned = len(self._text)
+        else:
             # Process any complete patterns in the order they appear
             await self.process_text_content()
 
-        # End of a full LLM response
-        # Driven by the prompt, the LLM should have asked the user for input
-        elif isinstance(frame, LLMFullResponseEndFrame):
-            # We use a different frame type, as to avoid image generation ingest
-            await self.push_frame(StoryPromptFrame(self._text))
-            self._text = ""
-            await self.push_frame(frame)
-            # Send an app message to the UI
-            await self.push_frame(DailyTransportMessageFrame(CUE_USER_TURN))
-            await self.push_frame(sounds["listening"])
+    async def _handle_llm_response_end(self, frame: LLMFullResponseEndFrame):
+        # End of a full LLM response. Driven by the prompt, the LLM should
+        # have asked the user for input, so we use a different frame type as
+        # to avoid image generation ingest, and cue the UI for the user turn.
+        await self._push_frames(
+            [
+                StoryPromptFrame(self._text),
+                frame,
+                DailyTransportMessageFrame(CUE_USER_TURN),
+                _LISTENING_SOUND,
+            ]
+        )
+        self._text = ""
+        self._scanned = 0
 
-        # Anything that is not a TextFrame pass through
-        else:
+    async def _push_frames(self, frames):
+        """Push a batch of frames downstream from a single call site."""
+        for frame in frames:
             await self.push_frame(frame)
 
     async def process_text_content(self):
         """Process text content in order of appearance, handling both image prompts and story breaks."""
+        pending = []
         while True:
-            # Find the first occurrence of each pattern
-            image_match = re.search(r"<(.*?)>", self._text)
-            break_match = re.search(r"\[[bB]reak\]", self._text)
+            # Find the first occurrence of each pattern, skipping the
+            # already-scanned prefix of the buffer
+            image_match = _IMAGE_RE.search(self._text, self._scanned)
+            break_start = self._text.lower().find(_BREAK_TOKEN, self._scanned)
 
             # If neither pattern is found, we're done processing
-            if not image_match and not break_match:
+            if not image_match and break_start < 0:
                 break
 
             # Find which pattern comes first in the text
             image_pos = image_match.start() if image_match else float("inf")
-            break_pos = break_match.start() if break_match else float("inf")
+            break_pos = break_start if break_start >= 0 else float("inf")
 
             if image_pos < break_pos:
                 # Process image prompt first
                 image_prompt = image_match.group(1)
                 # Remove the image prompt from the text
                 self._text = self._text[: image_match.start()] + self._text[image_match.end() :]
-                await self.push_frame(StoryImageFrame(image_prompt))
+                # Don't advance _scanned here: an incomplete "[break]" prefix
+                # may sit between it and the removed token.
+                pending.append(StoryImageFrame(image_prompt))
             else:
-                # Process story break first
-                parts = re.split(r"\[[bB]reak\]", self._text, flags=re.IGNORECASE, maxsplit=1)
-                before_break = parts[0].replace("\n", " ").strip()
+                # Process story break first, reusing the position we already
+                # have instead of scanning the buffer again
+                before_break = self._text[:break_start].replace("\n", " ").strip()
 
                 if len(before_break) > 2:
                     self._story.append(before_break)
-                    await self.push_frame(StoryPageFrame(before_break))
-                    # await self.push_frame(sounds["ding"])
-                    await self.push_frame(DailyTransportMessageFrame(CUE_ASSISTANT_TURN))
+                    pending.append(StoryPageFrame(before_break))
+                    # pending.append(sounds["ding"])
+                    pending.append(DailyTransportMessageFrame(CUE_ASSISTANT_TURN))
 
                 # Keep the remainder (if any) in the buffer
-                self._text = parts[1].strip() if len(parts) > 1 else ""
+                self._text = self._text[break_start + len(_BREAK_TOKEN) :].strip()
+                self._scanned = 0
+
+        # Remember how far we scanned. An unmatched "<" or "[" may still be
+        # waiting for its other half in a later frame, so we can only advance
+        # to the first sentinel that remains (or the end of the buffer).
+        angle = self._text.find("<", self._scanned)
+        bracket = self._text.find("[", self._scanned)
+        positions = [p for p in (angle, bracket) if p >= 0]
+        self._scanned = min(positions) if positions else len(self._text)
+
+        if pending:
+            await self._push_frames(pending)